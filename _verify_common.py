@@ -0,0 +1,42 @@
+"""
+Shared helpers for the verification scripts
+"""
+import functools
+import hashlib
+import os
+import pickle
+
+_CACHE_DIR = '.verify_cache'
+
+
+@functools.lru_cache(maxsize=None)
+def load(path):
+    """
+    Read a source file once per process, as raw bytes.
+
+    Both verification scripts check the same files; caching here means
+    each file is opened and read a single time no matter how many
+    checks consume it. Returning bytes skips the UTF-8 decode and the
+    unicode buffer entirely - the substring scans run on raw bytes and
+    ast.parse accepts bytes directly. Across processes (the scripts are
+    usually run back-to-back) a pickle keyed on the file's mtime and
+    size serves the bytes again, and goes stale the moment the file
+    changes.
+    """
+    st = os.stat(path)
+    key = hashlib.sha256(
+        f'{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}'.encode()
+    ).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f'{key}.src.pkl')
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+    with open(path, 'rb') as f:
+        code = f.read()
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(code, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return code
@@ -0,0 +1,116 @@
+"""
+BSR Downsampling Kernels
+Compiled min/max downsampling kernels shared by the explorer display paths
+"""
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from tsdownsample import MinMaxDownsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    MinMaxDownsampler = None
+    TSDOWNSAMPLE_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def downsample_minmax(data, start_idx, dt, num_bins, bin_size, out_time, out_data):
+        """
+        Single-pass min/max downsampling kernel.
+
+        Walks each bin once, tracking min/max value and position in scalar
+        registers, and writes the two points per bin directly into the
+        preallocated output arrays in time order. Timestamps are recovered
+        from sample indices (start_idx + offset) * dt, so no time array is
+        ever read. Bins run in parallel.
+        """
+        for b in prange(num_bins):
+            base = b * bin_size
+            mn = data[base]
+            mx = mn
+            mni = 0
+            mxi = 0
+            for k in range(1, bin_size):
+                v = data[base + k]
+                if v < mn:
+                    mn = v
+                    mni = k
+                if v > mx:
+                    mx = v
+                    mxi = k
+            if mni <= mxi:
+                out_time[2 * b] = (start_idx + base + mni) * dt
+                out_data[2 * b] = mn
+                out_time[2 * b + 1] = (start_idx + base + mxi) * dt
+                out_data[2 * b + 1] = mx
+            else:
+                out_time[2 * b] = (start_idx + base + mxi) * dt
+                out_data[2 * b] = mx
+                out_time[2 * b + 1] = (start_idx + base + mni) * dt
+                out_data[2 * b + 1] = mn
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def deinterleave_channels(data2d, out):
+        """
+        Fused deinterleave: one pass over the interleaved (N, C) samples.
+
+        Reading the AoS rows once streams every byte through cache a
+        single time, instead of one strided scan per channel; on a
+        sequentially madvise'd memmap this also keeps page reads in file
+        order, so all channels share the same readahead.
+        """
+        n, c = data2d.shape
+        for i in prange(n):
+            for j in range(c):
+                out[j, i] = data2d[i, j]
+
+    @functools.lru_cache(maxsize=4)
+    def specialized_minmax(bin_size):
+        """
+        Compile a downsample kernel with the bin size baked in as a constant.
+
+        With a compile-time trip count LLVM can unroll the inner scan. Only
+        worth it for bin sizes that repeat across calls - the full-file
+        initial view, where bin_size is fixed by (file length, display
+        budget) - since each new size pays a JIT compile. Zooming uses the
+        generic kernel.
+        """
+        @njit(parallel=True, fastmath=True, boundscheck=False)
+        def _kernel(data, start_idx, dt, num_bins, out_time, out_data):
+            for b in prange(num_bins):
+                base = b * bin_size
+                mn = data[base]
+                mx = mn
+                mni = 0
+                mxi = 0
+                for k in range(1, bin_size):
+                    v = data[base + k]
+                    if v < mn:
+                        mn = v
+                        mni = k
+                    if v > mx:
+                        mx = v
+                        mxi = k
+                if mni <= mxi:
+                    out_time[2 * b] = (start_idx + base + mni) * dt
+                    out_data[2 * b] = mn
+                    out_time[2 * b + 1] = (start_idx + base + mxi) * dt
+                    out_data[2 * b + 1] = mx
+                else:
+                    out_time[2 * b] = (start_idx + base + mxi) * dt
+                    out_data[2 * b] = mx
+                    out_time[2 * b + 1] = (start_idx + base + mni) * dt
+                    out_data[2 * b + 1] = mn
+        return _kernel
+else:
+    downsample_minmax = None
+    specialized_minmax = None
+    deinterleave_channels = None
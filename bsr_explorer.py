@@ -8,9 +8,8 @@ License: MIT
 """
 import sys
 import os
-import json
+import functools
 import subprocess
-from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
     QHBoxLayout, QPushButton, QLabel, QFileDialog, 
@@ -18,17 +17,23 @@ from PyQt6.QtWidgets import (
     QDialog, QFormLayout, QLineEdit, QDialogButtonBox, QMenuBar,
     QMessageBox, QTextEdit, QProgressDialog
 )
-from PyQt6.QtCore import Qt, QMimeData, QStandardPaths, QTimer
+from PyQt6.QtCore import (
+    Qt, QMimeData, QSettings, QTimer, QObject, QRunnable,
+    QThreadPool, pyqtSignal
+)
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QAction
 import pyqtgraph as pg
 import numpy as np
 from bsr_reader import BSRReader
+from bsr_downsample import (
+    NUMBA_AVAILABLE, TSDOWNSAMPLE_AVAILABLE,
+    downsample_minmax, specialized_minmax, MinMaxDownsampler
+)
 
 __version__ = "1.2.1"
 __author__ = "Adrian Shajkofci"
 __license__ = "MIT"
 
-
 def get_git_version():
     """Get the git commit hash if available"""
     try:
@@ -163,6 +168,71 @@ class SettingsDialog(QDialog):
         return channel_names, sample_rate, max_samples
 
 
+class BSRLoadSignals(QObject):
+    """Signal sidecar for BSRLoadWorker (QRunnable cannot emit directly)"""
+    finished = pyqtSignal(bool, object)
+
+
+class BSRLoadWorker(QRunnable):
+    """
+    Background worker that loads a BSR file off the UI thread.
+
+    Memory-maps the file, deinterleaves it into contiguous float32 channel
+    arrays, and builds a min/max pyramid per channel, then signals the
+    result back to the main thread.
+    """
+
+    # Coarsest pyramid level stops at this many entries
+    PYRAMID_FLOOR = 4096
+
+    def __init__(self, reader, filename):
+        super().__init__()
+        self.reader = reader
+        self.filename = filename
+        self.signals = BSRLoadSignals()
+
+    @staticmethod
+    def build_pyramid(channel_data, floor=PYRAMID_FLOOR):
+        """
+        Build a multi-resolution min/max pyramid for one channel.
+
+        Level k holds the min and max of every 2**k raw samples, so any
+        zoom level can be served from at most ~2x the display budget of
+        pyramid entries instead of rescanning raw samples.
+        """
+        levels = [None]  # Level 0 is the raw channel itself
+        mins = maxs = channel_data
+        while len(mins) > floor:
+            n = len(mins) // 2 * 2
+            mins = np.minimum(mins[0:n:2], mins[1:n:2])
+            maxs = np.maximum(maxs[0:n:2], maxs[1:n:2])
+            levels.append((mins, maxs))
+        return levels
+
+    def run(self):
+        channels = None
+        pyramids = None
+        try:
+            ok = self.reader.load_file(self.filename)
+            if ok:
+                # float32 is plenty for screen resolution and halves the
+                # bytes every redraw streams through the kernels and Qt
+                channels = self.reader.get_channels_soa(dtype=np.float32)
+            # The reader can be closed from the UI thread (tab closed while
+            # still loading), in which case get_channels_soa returns None
+            if channels is None:
+                ok = False
+                pyramids = None
+            else:
+                pyramids = [self.build_pyramid(ch) for ch in channels]
+        except Exception as e:
+            print(f"Error loading file: {e}")
+            ok = False
+            channels = None
+            pyramids = None
+        self.signals.finished.emit(ok, (channels, pyramids))
+
+
 class FileTab(QWidget):
     """Widget for a single file tab"""
     
@@ -177,9 +247,21 @@ class FileTab(QWidget):
         self.exploded_mode = False
         self.channel_names = channel_names
         self.range_change_connected = False  # Track if signal is connected
-        self.last_x_range = None  # Track last X range to detect zoom vs pan
+        self._last_expanded = None  # (start_idx, end_idx, bin_size) of last resample
+        self._last_down = {}  # Per-channel (time, data) from last resample
+        self._plot_stale = set()  # Channels skipped by an update while hidden
+        self._rebuild_pending = False  # Coalesces deferred plot rebuilds
+        self._full_view_cache = {}  # Per-channel full-file downsampled view
         self.max_display_samples = 100000  # Configurable max samples
-        
+        self._channels = None  # Per-channel contiguous arrays (SoA)
+        self._pyramids = None  # Per-channel min/max pyramids
+        # Coalesce bursts of range-change events into one resample
+        self._resample_timer = QTimer(self)
+        self._resample_timer.setSingleShot(True)
+        self._resample_timer.setInterval(50)
+        self._resample_timer.timeout.connect(self._do_resample)
+        self._alloc_downsample_buffers()
+
         self.init_ui()
         self.load_file(filename)
         
@@ -218,7 +300,7 @@ class FileTab(QWidget):
         for i in range(4):
             cb = QCheckBox(self.channel_names[i])
             cb.setChecked(True)
-            cb.stateChanged.connect(lambda state, idx=i: self.toggle_channel(idx, state))
+            cb.stateChanged.connect(functools.partial(self.toggle_channel, i))
             self.channel_checkboxes.append(cb)
             layout.addWidget(cb)
         
@@ -236,13 +318,55 @@ class FileTab(QWidget):
             for i, plot in enumerate(self.plots):
                 plot.setTitle(channel_names[i])
     
+    def _invalidate_display_caches(self):
+        """
+        Drop all caches derived from the loaded data, sample rate or
+        display budget.
+
+        The pan-reuse cache compares raw sample indices and bin size,
+        neither of which encodes dt, so it must be dropped together with
+        the full-view cache or a pan after a sample-rate change would
+        re-serve curves timestamped with the old rate.
+        """
+        self._full_view_cache.clear()
+        self._last_expanded = None
+        self._last_down.clear()
+
     def update_sample_rate(self, sample_rate):
         """Update sample rate and refresh plots"""
         self.reader.sample_rate = sample_rate
+        self._invalidate_display_caches()
         if self.reader.data is not None:
             self.update_info_label()
             self.update_plots()
     
+    def _make_plot_widget(self, title):
+        """Create a plot widget with the shared rendering policy applied"""
+        plot_widget = pg.PlotWidget(title=title)
+        plot_widget.setLabel('left', 'Amplitude')
+        plot_widget.setLabel('bottom', 'Time', units='s')
+        # The global config only sets defaults; request the GL viewport and
+        # disable antialiasing explicitly so every backend honours them
+        plot_widget.useOpenGL(True)
+        plot_widget.setAntialiasing(False)
+        # Opaque grid: translucent grid lines force alpha compositing on
+        # every repaint, which is expensive at HiDPI
+        plot_widget.showGrid(x=True, y=True)
+        return plot_widget
+
+    def _make_plot_item(self, plot_widget, color, name=None):
+        """Create a data item with the shared rendering policy applied"""
+        plot_item = plot_widget.plot(
+            pen=pg.mkPen(color=color, width=1, cosmetic=True),
+            skipFiniteCheck=True,
+            **({'name': name} if name else {})
+        )
+        # Let pyqtgraph reduce to screen resolution and clip to the
+        # viewport in its compiled path before building paint paths
+        plot_item.setDownsampling(auto=True, method='peak')
+        plot_item.setClipToView(True)
+        return plot_item
+
     def setup_plots(self):
         """Setup plot widgets"""
         # Clear existing plots - properly remove from QSplitter
@@ -256,8 +380,9 @@ class FileTab(QWidget):
         # Reset signal connection flag since old plot widgets are deleted
         self.range_change_connected = False
         
-        # Configure pyqtgraph for performance
-        pg.setConfigOptions(antialias=False, useOpenGL=True)
+        # Configure pyqtgraph for performance; useNumba accelerates its
+        # internal peak-downsampler when numba is installed
+        pg.setConfigOptions(antialias=False, useOpenGL=True, useNumba=NUMBA_AVAILABLE)
         
         if self.exploded_mode:
             # Create 4 separate plots in the same window with linked X axis
@@ -266,17 +391,14 @@ class FileTab(QWidget):
             num_channels = len(self.channel_names)
             
             for i in range(num_channels):
-                plot_widget = pg.PlotWidget(title=self.channel_names[i])
-                plot_widget.setLabel('left', 'Amplitude')
-                plot_widget.setLabel('bottom', 'Time', units='s')
-                plot_widget.showGrid(x=True, y=True, alpha=0.3)
-                
+                plot_widget = self._make_plot_widget(self.channel_names[i])
+
                 # Link X axis to first plot (time axis locked together)
                 if first_plot is None:
                     first_plot = plot_widget
                     # Connect view range change to update data dynamically (only once)
                     if not self.range_change_connected:
-                        plot_widget.sigRangeChanged.connect(lambda: self.on_view_range_changed())
+                        plot_widget.sigRangeChanged.connect(self.on_view_range_changed)
                         self.range_change_connected = True
                 else:
                     plot_widget.setXLink(first_plot)
@@ -287,7 +409,7 @@ class FileTab(QWidget):
                 # Keep Y axis in auto-range so amplitude adapts on zoom
                 plot_widget.getViewBox().enableAutoRange(axis=pg.ViewBox.YAxis, enable=True)
                 
-                plot_item = plot_widget.plot(pen=pg.mkPen(color=colors[i], width=1))
+                plot_item = self._make_plot_item(plot_widget, colors[i])
                 self.plot_items.append(plot_item)
                 self.plots.append(plot_widget)
                 self.plot_splitter.addWidget(plot_widget)
@@ -297,10 +419,7 @@ class FileTab(QWidget):
                 plot_widget.setVisible(is_checked)
         else:
             # Create single combined plot
-            plot_widget = pg.PlotWidget(title="All Channels")
-            plot_widget.setLabel('left', 'Amplitude')
-            plot_widget.setLabel('bottom', 'Time', units='s')
-            plot_widget.showGrid(x=True, y=True, alpha=0.3)
+            plot_widget = self._make_plot_widget("All Channels")
             plot_widget.addLegend()
             
             # Enable mouse interaction
@@ -311,14 +430,13 @@ class FileTab(QWidget):
             
             # Connect view range change to update data dynamically (only once)
             if not self.range_change_connected:
-                plot_widget.sigRangeChanged.connect(lambda: self.on_view_range_changed())
+                plot_widget.sigRangeChanged.connect(self.on_view_range_changed)
                 self.range_change_connected = True
             
             colors = ['r', 'g', 'b', 'y']
             for i in range(4):
-                plot_item = plot_widget.plot(
-                    pen=pg.mkPen(color=colors[i], width=1),
-                    name=self.channel_names[i]
+                plot_item = self._make_plot_item(
+                    plot_widget, colors[i], name=self.channel_names[i]
                 )
                 self.plot_items.append(plot_item)
             
@@ -328,8 +446,17 @@ class FileTab(QWidget):
     def toggle_view_mode(self, state):
         """Toggle between combined and exploded view"""
         self.exploded_mode = (state == Qt.CheckState.Checked.value)
+        # Rebuild on the next event-loop tick so the checkbox repaints
+        # before the plot teardown/reconstruction blocks the UI
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            QTimer.singleShot(0, self._rebuild_plots)
+
+    def _rebuild_plots(self):
+        """Rebuild the plot layout for the current view mode"""
+        self._rebuild_pending = False
         self.setup_plots()
-        
+
         # Reload data if available
         if self.reader.data is not None:
             self.update_plots()
@@ -342,64 +469,53 @@ class FileTab(QWidget):
             if self.exploded_mode and channel_idx < len(self.plots):
                 # In exploded mode, show/hide entire plot widget
                 self.plots[channel_idx].setVisible(visible)
-                # Update data if making visible
-                if visible and self.reader.data is not None:
+                # Refresh data only if it went stale while hidden
+                if visible and self.reader.data is not None and self._plot_is_stale(channel_idx):
                     self.update_channel_plot(channel_idx)
             else:
-                # In combined mode, hide/show the plot item
-                if visible:
+                # In combined mode, flip item visibility - O(1) - instead of
+                # pushing empty arrays through the full setData pipeline
+                self.plot_items[channel_idx].setVisible(visible)
+                if visible and self._plot_is_stale(channel_idx):
                     self.update_channel_plot(channel_idx)
-                else:
-                    self.plot_items[channel_idx].setData([], [])
+
+    def _plot_is_stale(self, channel_idx: int) -> bool:
+        """Whether a plot item's data missed an update while hidden"""
+        if channel_idx in self._plot_stale:
+            return True
+        item = self.plot_items[channel_idx]
+        return item.xData is None or len(item.xData) == 0
     
     def load_file(self, filename: str):
-        """Load and display BSR file"""
-        # Create progress dialog with cancel button
-        progress = QProgressDialog("Loading BSR file...", "Cancel", 0, 100, self)
-        progress.setWindowTitle("Loading")
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.setValue(10)
-        QApplication.processEvents()
-        
-        if progress.wasCanceled():
-            return
+        """Load and display BSR file on a worker thread"""
+        # An indeterminate dialog keeps the user informed while the memmap
+        # open and channel deinterleave run off the UI thread; the event
+        # loop stays live so the window remains responsive
+        self._load_progress = QProgressDialog("Loading BSR file...", None, 0, 0, self)
+        self._load_progress.setWindowTitle("Loading")
+        self._load_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._load_progress.setMinimumDuration(0)
         
         self.info_label.setText(f"Loading {os.path.basename(filename)}...")
-        QApplication.processEvents()
         
-        # Load file
-        progress.setValue(30)
-        progress.setLabelText("Reading file data...")
-        QApplication.processEvents()
+        self._load_worker = BSRLoadWorker(self.reader, filename)
+        self._load_worker.signals.finished.connect(self._on_load_finished)
+        QThreadPool.globalInstance().start(self._load_worker)
+    
+    def _on_load_finished(self, ok: bool, payload):
+        """Apply loaded data on the main thread once the worker is done"""
+        self._load_progress.close()
+        self._load_progress = None
+        self._load_worker = None
         
-        if progress.wasCanceled():
+        if not ok:
+            self.info_label.setText("Error loading file")
             return
         
-        if self.reader.load_file(filename):
-            if progress.wasCanceled():
-                return
-                
-            progress.setValue(60)
-            progress.setLabelText("Processing data...")
-            QApplication.processEvents()
-            
-            self.update_info_label()
-            
-            if progress.wasCanceled():
-                return
-                
-            progress.setValue(80)
-            progress.setLabelText("Updating plots...")
-            QApplication.processEvents()
-            
-            self.update_plots()
-            
-            progress.setValue(100)
-            progress.close()
-        else:
-            progress.close()
-            self.info_label.setText("Error loading file")
+        self._channels, self._pyramids = payload
+        self._invalidate_display_caches()
+        self.update_info_label()
+        self.update_plots()
     
     def update_info_label(self):
         """Update the info label with file statistics"""
@@ -415,120 +531,260 @@ class FileTab(QWidget):
     
     def update_plots(self):
         """Update plot with current data"""
-        if self.reader.data is None:
+        if self._channels is None:
             return
         
-        time_axis = self.reader.get_time_axis()
-        
-        # For large files, downsample for initial view using histogram method
-        num_samples = len(time_axis)
-        
-        # Update each channel
-        for i in range(4):
-            if i < len(self.channel_checkboxes) and self.channel_checkboxes[i].isChecked():
-                channel_data = self.reader.get_channel(i)
-                
-                if num_samples > self.max_display_samples:
-                    # Use histogram-based downsampling
-                    time_down, data_down = self.histogram_downsample(
-                        channel_data, time_axis, self.max_display_samples
-                    )
+        # Suspend painting while all channels are updated so Qt coalesces
+        # the batch into a single repaint per widget
+        for plot_widget in self.plots:
+            plot_widget.setUpdatesEnabled(False)
+        try:
+            # Update each channel
+            for i in range(4):
+                if i < len(self.channel_checkboxes) and self.channel_checkboxes[i].isChecked():
+                    time_down, data_down = self._full_view(i)
                     self.plot_items[i].setData(time_down, data_down)
+                    self._plot_stale.discard(i)
                 else:
-                    # Show full resolution
-                    self.plot_items[i].setData(time_axis, channel_data)
+                    self._plot_stale.add(i)
+        finally:
+            for plot_widget in self.plots:
+                plot_widget.setUpdatesEnabled(True)
+                plot_widget.update()
     
     def update_channel_plot(self, channel_idx: int):
         """Update a specific channel plot"""
-        if self.reader.data is None or channel_idx >= len(self.plot_items):
+        if self._channels is None or channel_idx >= len(self.plot_items):
             return
         
-        time_axis = self.reader.get_time_axis()
-        channel_data = self.reader.get_channel(channel_idx)
-        num_samples = len(time_axis)
-        
-        if num_samples > self.max_display_samples:
-            # Use histogram-based downsampling
-            time_down, data_down = self.histogram_downsample(
-                channel_data, time_axis, self.max_display_samples
-            )
-            self.plot_items[channel_idx].setData(time_down, data_down)
-        else:
-            # Show full resolution
-            self.plot_items[channel_idx].setData(time_axis, channel_data)
+        time_down, data_down = self._full_view(channel_idx)
+        self.plot_items[channel_idx].setData(time_down, data_down)
+        self._plot_stale.discard(channel_idx)
     
     def update_max_display_samples(self, max_samples):
         """Update max display samples setting"""
         self.max_display_samples = max_samples
+        self._alloc_downsample_buffers()
+        self._invalidate_display_caches()
         if self.reader.data is not None:
             self.update_plots()
+
+    def _alloc_downsample_buffers(self):
+        """
+        Preallocate per-channel output buffers for the downsampling kernel.
+
+        One row per channel so the buffers can be reused across zoom events
+        without channels overwriting each other's display data.
+        """
+        # Time stays float64: float32 cannot resolve one sample period once
+        # the timestamp exceeds a few tens of seconds at 200 kHz
+        capacity = 2 * max(1, self.max_display_samples // 2)
+        self._ds_buf_time = np.empty((4, capacity), dtype=np.float64)
+        self._ds_buf_data = np.empty((4, capacity), dtype=np.float32)
+        # Reusable index ramp; hot paths slice it instead of re-running
+        # np.arange on every call
+        self._arange_f64 = np.arange(max(capacity, self.max_display_samples),
+                                     dtype=np.float64)
+        self._bin_starts_key = None
+        self._bin_starts_cache = None
     
-    def histogram_downsample(self, data, time_axis, target_samples):
+    def _full_view(self, channel_idx):
         """
-        Fast fully-vectorized downsampling using histogram-based approach that preserves extrema.
+        Full-file downsampled view for one channel, cached across toggles.
+
+        Copies decouple the cache from the kernel's reused output buffers,
+        so later zoom resamples cannot clobber a cached view.
+        """
+        cached = self._full_view_cache.get(channel_idx)
+        if cached is None:
+            time_down, data_down = self._downsample_window(
+                channel_idx, 0, self.reader.get_num_samples(), specialize=True
+            )
+            cached = (np.array(time_down, copy=True), np.array(data_down, copy=True))
+            self._full_view_cache[channel_idx] = cached
+        return cached
+
+    def _downsample_window(self, channel_idx, start_idx, end_idx, specialize=False):
+        """
+        Downsample [start_idx, end_idx) of one channel for display.
+
+        Serves the window from the coarsest pyramid level that still meets
+        the display budget, so redraw cost is O(max_display_samples)
+        regardless of file size. Near-full zoom falls through to the exact
+        min/max kernel on raw samples.
+
+        Returns:
+            Tuple of (time, data) ready for setData
+        """
+        data = self._channels[channel_idx]
+        visible = end_idx - start_idx
+        dt = 1.0 / self.reader.sample_rate
+        
+        if visible <= self.max_display_samples:
+            # Full resolution; fall back to a fresh ramp if the cached one
+            # is shorter than the window (the display budget can be raised
+            # after the buffers were allocated)
+            if visible <= len(self._arange_f64):
+                ramp = self._arange_f64[:visible]
+            else:
+                ramp = np.arange(visible, dtype=np.float64)
+            time_slice = (start_idx + ramp) * dt
+            return time_slice, data[start_idx:end_idx]
+        
+        # Pick the coarsest level that still yields >= max_display_samples
+        levels = self._pyramids[channel_idx] if self._pyramids else [None]
+        level = 0
+        while (level < len(levels) - 1
+                and (visible >> (level + 1)) > self.max_display_samples):
+            level += 1
+        
+        if level == 0:
+            return self.histogram_downsample(
+                data[start_idx:end_idx], start_idx,
+                self.max_display_samples, channel_idx, specialize
+            )
         
+        # Aggregate pyramid entries into display bins
+        mins, maxs = levels[level]
+        lo = start_idx >> level
+        hi = min(len(mins), ((end_idx - 1) >> level) + 1)
+        m = mins[lo:hi]
+        big = maxs[lo:hi]
+        count = hi - lo
+        num_bins = max(1, self.max_display_samples // 2)
+        if count > num_bins:
+            # Ceiling division with a ragged last bin: every pyramid entry
+            # in [lo, hi) lands in some display bin, instead of the old
+            # floor-division truncation dropping the trailing count %
+            # num_bins entries (up to a quarter of the visible window)
+            entries_per_bin = -(-count // num_bins)
+            num_bins = -(-count // entries_per_bin)
+            starts = np.arange(num_bins, dtype=np.intp) * entries_per_bin
+            m = np.minimum.reduceat(m, starts)
+            big = np.maximum.reduceat(big, starts)
+        else:
+            num_bins = count
+            entries_per_bin = 1
+
+        # Two points per bin spanning its left and right edge; the ragged
+        # last bin's right edge is clamped to the end of the window
+        block = (1 << level) * entries_per_bin
+        left = (lo << level) + self._arange_f64[:num_bins] * block
+        right = np.minimum(left + block, float(hi << level))
+        out_time = self._ds_buf_time[channel_idx, :2 * num_bins]
+        out_data = self._ds_buf_data[channel_idx, :2 * num_bins]
+        out_time[0::2] = left * dt
+        out_time[1::2] = right * dt
+        out_data[0::2] = m
+        out_data[1::2] = big
+        return out_time, out_data
+
+    def _bin_starts(self, num_bins, bin_size):
+        """Bin start offsets for reduceat, cached for a stable zoom level"""
+        key = (num_bins, bin_size)
+        if self._bin_starts_key != key:
+            self._bin_starts_cache = np.arange(num_bins, dtype=np.intp) * bin_size
+            self._bin_starts_key = key
+        return self._bin_starts_cache
+
+    def histogram_downsample(self, data, start_idx, target_samples,
+                             channel_idx=0, specialize=False):
+        """
+        Fast downsampling using a min/max-per-bin approach that preserves extrema.
+
+        Uses a single-pass parallel Numba kernel writing into preallocated
+        per-channel buffers when available, falling back to vectorized NumPy.
+        Time is uniform, so timestamps are recovered from sample indices
+        rather than carrying a parallel time array through the kernel.
+
         Args:
             data: Channel data to downsample
-            time_axis: Corresponding time axis
+            start_idx: Absolute sample index of data[0] in the file
             target_samples: Target number of samples
-            
+            channel_idx: Channel index selecting the reusable output buffer
+            specialize: Use a kernel compiled for this exact bin size;
+                only pays off when the bin size repeats across calls
+
         Returns:
             Tuple of (downsampled_time, downsampled_data)
         """
+        dt = 1.0 / self.reader.sample_rate
+
         if len(data) <= target_samples or target_samples <= 0:
+            time_axis = (start_idx + np.arange(len(data), dtype=np.float64)) * dt
             return time_axis, data
-        
+
         # Calculate bin size - use target_samples // 2 since we keep 2 points per bin
         num_bins = max(1, target_samples // 2)
         bin_size = len(data) // num_bins
-        
-        if bin_size <= 0:
-            return time_axis, data
-        
+
         # Truncate data to fit evenly into bins for vectorization
         n_samples = num_bins * bin_size
         data_truncated = data[:n_samples]
-        time_truncated = time_axis[:n_samples]
-        
-        # Reshape into bins for vectorized operations
-        data_bins = data_truncated.reshape(num_bins, bin_size)
-        time_bins = time_truncated.reshape(num_bins, bin_size)
-        
-        # Find min and max indices in each bin (vectorized)
-        min_indices = np.argmin(data_bins, axis=1)
-        max_indices = np.argmax(data_bins, axis=1)
-        
-        # Extract min and max values and times using advanced indexing
-        bin_range = np.arange(num_bins)
-        min_data = data_bins[bin_range, min_indices]
-        max_data = data_bins[bin_range, max_indices]
-        min_time = time_bins[bin_range, min_indices]
-        max_time = time_bins[bin_range, max_indices]
-        
-        # Fully vectorized interleaving of min and max in time order
-        # Determine which comes first: min or max
-        min_first = min_indices <= max_indices
-        
-        # Create output arrays (2 points per bin, but may be same point)
-        # Pre-allocate for max size (2 * num_bins)
-        first_time = np.where(min_first, min_time, max_time)
-        first_data = np.where(min_first, min_data, max_data)
-        second_time = np.where(min_first, max_time, min_time)
-        second_data = np.where(min_first, max_data, min_data)
-        
-        # Interleave: [first0, second0, first1, second1, ...]
-        result_time = np.empty(2 * num_bins, dtype=time_axis.dtype)
-        result_data = np.empty(2 * num_bins, dtype=data.dtype)
-        result_time[0::2] = first_time
-        result_time[1::2] = second_time
-        result_data[0::2] = first_data
-        result_data[1::2] = second_data
-        
+
+        if NUMBA_AVAILABLE and 2 * num_bins <= self._ds_buf_time.shape[1]:
+            # Single fused pass: min/max tracked in registers, interleaved
+            # output written directly into the reusable buffer row
+            out_time = self._ds_buf_time[channel_idx, :2 * num_bins]
+            out_data = self._ds_buf_data[channel_idx, :2 * num_bins]
+            data_truncated = np.ascontiguousarray(data_truncated)
+            if specialize:
+                specialized_minmax(bin_size)(
+                    data_truncated, start_idx, dt, num_bins, out_time, out_data
+                )
+            else:
+                downsample_minmax(
+                    data_truncated, start_idx, dt, num_bins, bin_size,
+                    out_time, out_data
+                )
+            return out_time, out_data
+
+        if TSDOWNSAMPLE_AVAILABLE:
+            # Rust/SIMD min-max selection; returns indices into the slice so
+            # exact extremum timestamps are preserved like the Numba path
+            idxs = MinMaxDownsampler().downsample(
+                data_truncated, n_out=2 * num_bins, parallel=True
+            )
+            time_out = (start_idx + idxs.astype(np.float64)) * dt
+            return time_out, data_truncated[idxs]
+
+        # NumPy fallback: fused per-bin reductions on the flat array.
+        # reduceat makes one pass per reduction instead of the old
+        # argmin + argmax + fancy-indexing + np.where pipeline. Without
+        # extremum indices the output points sit on the bin edges, which is
+        # indistinguishable on screen at these bin widths (the Numba kernel
+        # keeps exact positions).
+        starts = self._bin_starts(num_bins, bin_size)
+
+        # Interleave [min0, max0, min1, max1, ...] into the reusable
+        # per-channel buffers when they fit
+        if 2 * num_bins <= self._ds_buf_time.shape[1]:
+            result_time = self._ds_buf_time[channel_idx, :2 * num_bins]
+            result_data = self._ds_buf_data[channel_idx, :2 * num_bins]
+        else:
+            result_time = np.empty(2 * num_bins, dtype=np.float64)
+            result_data = np.empty(2 * num_bins, dtype=data.dtype)
+        # Reduce straight into the strided halves of the output buffer, so
+        # no per-call min/max temporaries churn through the allocator
+        np.minimum.reduceat(data_truncated, starts, out=result_data[0::2])
+        np.maximum.reduceat(data_truncated, starts, out=result_data[1::2])
+        result_time[0::2] = (start_idx + starts).astype(np.float64) * dt
+        result_time[1::2] = (start_idx + starts + bin_size).astype(np.float64) * dt
+
         return result_time, result_data
     
     def on_view_range_changed(self):
-        """Handle view range changes to dynamically resample data on zoom only"""
-        if self.reader.data is None or len(self.plots) == 0:
+        """
+        Handle view range changes by (re)starting the debounce timer.
+
+        Drag-zooms emit dozens of range changes per second; only the last
+        one within the debounce window triggers an actual resample.
+        """
+        self._resample_timer.start()
+
+    def _do_resample(self):
+        """Resample the visible data after the view range has settled"""
+        if self._channels is None or len(self.plots) == 0:
             return
         
         # Get the view range from the first plot (they're all linked)
@@ -536,24 +792,11 @@ class FileTab(QWidget):
         view_range = plot.viewRange()
         x_range = view_range[0]  # [min_time, max_time]
         
-        # Check if this is a zoom (range size changed) or just a pan (range shifted)
         current_range_size = x_range[1] - x_range[0]
         
-        if self.last_x_range is not None:
-            last_range_size = self.last_x_range[1] - self.last_x_range[0]
-            # Only update if zoom changed (range size changed significantly)
-            # Use 0.1% threshold for more sensitive detection
-            if last_range_size > 0 and abs(current_range_size - last_range_size) / last_range_size < 0.001:
-                # This is just a pan, not a zoom - don't resample
-                self.last_x_range = x_range
-                return
-        
-        # Update last range before resampling
-        self.last_x_range = x_range
-        
         # Calculate which data points are visible
-        time_axis_full = self.reader.get_time_axis()
-        num_samples = len(time_axis_full)
+        num_samples = self.reader.get_num_samples()
+        sample_rate = self.reader.sample_rate
         
         # Expand range by 2x on each side for better context
         range_margin = current_range_size  # Add 1x range on each side (total 3x)
@@ -561,8 +804,8 @@ class FileTab(QWidget):
         expanded_end = x_range[1] + range_margin
         
         # Find indices for expanded range
-        start_idx = max(0, int(expanded_start * self.reader.sample_rate))
-        end_idx = min(num_samples, int(expanded_end * self.reader.sample_rate))
+        start_idx = max(0, int(expanded_start * sample_rate))
+        end_idx = min(num_samples, int(expanded_end * sample_rate))
         
         # Calculate how many points are in the visible range
         visible_samples = end_idx - start_idx
@@ -570,24 +813,41 @@ class FileTab(QWidget):
         if visible_samples <= 0:
             return
         
-        # Update plots with appropriate data resolution
-        for i in range(4):
-            if i < len(self.channel_checkboxes) and self.channel_checkboxes[i].isChecked():
-                channel_data = self.reader.get_channel(i)
-                
-                if visible_samples > self.max_display_samples:
-                    # Use histogram-based downsampling to preserve extrema
-                    time_slice = time_axis_full[start_idx:end_idx]
-                    data_slice = channel_data[start_idx:end_idx]
-                    time_down, data_down = self.histogram_downsample(
-                        data_slice, time_slice, self.max_display_samples
-                    )
+        bin_size = max(1, visible_samples // max(1, self.max_display_samples // 2))
+        
+        # Pans and small zooms inside the previous expanded window can reuse
+        # the cached downsampled arrays - no slicing, no recomputation
+        if self._last_expanded is not None:
+            vis_start = max(0, int(x_range[0] * sample_rate))
+            vis_end = min(num_samples, int(x_range[1] * sample_rate))
+            c_start, c_end, c_bin = self._last_expanded
+            if (vis_start >= c_start and vis_end <= c_end
+                    and abs(bin_size - c_bin) / c_bin < 0.2):
+                for i, (time_down, data_down) in self._last_down.items():
+                    if self.channel_checkboxes[i].isChecked():
+                        self.plot_items[i].setData(time_down, data_down)
+                return
+        
+        # Update plots with appropriate data resolution; timestamps are
+        # recovered from sample indices so no full time axis is built.
+        # Painting is suspended so the four setData calls repaint once.
+        self._last_down.clear()
+        for plot_widget in self.plots:
+            plot_widget.setUpdatesEnabled(False)
+        try:
+            for i in range(4):
+                if i < len(self.channel_checkboxes) and self.channel_checkboxes[i].isChecked():
+                    time_down, data_down = self._downsample_window(i, start_idx, end_idx)
                     self.plot_items[i].setData(time_down, data_down)
+                    self._last_down[i] = (time_down, data_down)
+                    self._plot_stale.discard(i)
                 else:
-                    # Show full resolution
-                    time_slice = time_axis_full[start_idx:end_idx]
-                    data_slice = channel_data[start_idx:end_idx]
-                    self.plot_items[i].setData(time_slice, data_slice)
+                    self._plot_stale.add(i)
+        finally:
+            for plot_widget in self.plots:
+                plot_widget.setUpdatesEnabled(True)
+                plot_widget.update()
+        self._last_expanded = (start_idx, end_idx, bin_size)
 
         # Re-apply Y auto-range after data updates from zoom
         for plot in self.plots:
@@ -606,39 +866,27 @@ class BSRExplorer(QMainWindow):
         
         self.init_ui()
         
-    def get_settings_path(self):
-        """Get OS-specific settings file path"""
-        app_data_dir = QStandardPaths.writableLocation(
-            QStandardPaths.StandardLocation.AppDataLocation
-        )
-        settings_dir = Path(app_data_dir) / "BSRExplorer"
-        settings_dir.mkdir(parents=True, exist_ok=True)
-        return settings_dir / "settings.json"
-    
     def load_settings(self):
-        """Load settings from OS-specific directory"""
+        """Load settings via the native QSettings backend"""
         try:
-            settings_path = self.get_settings_path()
-            if settings_path.exists():
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    self.channel_names = settings.get('channel_names', self.channel_names)
-                    self.sample_rate = settings.get('sample_rate', self.sample_rate)
-                    self.max_display_samples = settings.get('max_display_samples', self.max_display_samples)
+            settings = QSettings("BSRExplorer", "BSRExplorer")
+            names = settings.value('channel_names', self.channel_names)
+            if isinstance(names, list) and len(names) == len(self.channel_names):
+                self.channel_names = [str(name) for name in names]
+            self.sample_rate = int(settings.value('sample_rate', self.sample_rate))
+            self.max_display_samples = int(
+                settings.value('max_display_samples', self.max_display_samples)
+            )
         except Exception as e:
             print(f"Could not load settings: {e}")
     
     def save_settings(self):
-        """Save settings to OS-specific directory"""
+        """Save settings via the native QSettings backend"""
         try:
-            settings_path = self.get_settings_path()
-            settings = {
-                'channel_names': self.channel_names,
-                'sample_rate': self.sample_rate,
-                'max_display_samples': self.max_display_samples
-            }
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f, indent=2)
+            settings = QSettings("BSRExplorer", "BSRExplorer")
+            settings.setValue('channel_names', self.channel_names)
+            settings.setValue('sample_rate', self.sample_rate)
+            settings.setValue('max_display_samples', self.max_display_samples)
         except Exception as e:
             print(f"Could not save settings: {e}")
         
@@ -661,6 +909,9 @@ class BSRExplorer(QMainWindow):
         # Create tab widget for multiple files
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabsClosable(True)
+        # Placeholder widgets for tabs whose FileTab is not built yet
+        self._pending_tabs = {}
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
         self.tab_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tab_widget.customContextMenuRequested.connect(self.show_tab_context_menu)
@@ -752,25 +1003,81 @@ class BSRExplorer(QMainWindow):
     
     def add_file_tab(self, filename: str):
         """Add a new tab for a file"""
-        # Remove welcome tab if present
+        # Re-focus an existing tab instead of reopening the same file;
+        # avoids a second memmap, cache warmup and plot rebuild
+        for i in range(self.tab_widget.count()):
+            widget = self.tab_widget.widget(i)
+            if ((isinstance(widget, FileTab) and widget.filename == filename)
+                    or self._pending_tabs.get(widget) == filename):
+                self.tab_widget.setCurrentIndex(i)
+                return
+
+        # Remove welcome tab if present (placeholders are pending file tabs)
         if self.tab_widget.count() == 1:
             widget = self.tab_widget.widget(0)
-            if not isinstance(widget, FileTab):
+            if not isinstance(widget, FileTab) and widget not in self._pending_tabs:
                 self.tab_widget.removeTab(0)
         
-        # Create new tab with current settings
-        tab = FileTab(self, filename, self.channel_names.copy(), self.sample_rate)
-        tab.max_display_samples = self.max_display_samples  # Apply max_display_samples
+        # Defer the expensive FileTab (plot widgets + file load) until the
+        # tab is first selected; a lightweight placeholder holds its spot so
+        # dropping many files stays cheap per file.
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        label = QLabel(f"Loading {os.path.basename(filename)}...")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(label)
+
+        self._pending_tabs[placeholder] = filename
         tab_name = os.path.basename(filename)
-        self.tab_widget.addTab(tab, tab_name)
-        self.tab_widget.setCurrentWidget(tab)
-    
+        index = self.tab_widget.addTab(placeholder, tab_name)
+        self.tab_widget.setCurrentIndex(index)
+
+    def _materialize_tab(self, index: int):
+        """
+        Build the real FileTab for a placeholder tab on first selection.
+
+        Deferred to the event loop so a burst of insertions (multi-file
+        drop) only materializes the tab that ends up current.
+        """
+        if index < 0:
+            return
+        if self.tab_widget.widget(index) in self._pending_tabs:
+            QTimer.singleShot(0, self._materialize_current)
+
+    def _materialize_current(self):
+        """Replace the current placeholder tab with its FileTab"""
+        index = self.tab_widget.currentIndex()
+        if index < 0:
+            return
+        widget = self.tab_widget.widget(index)
+        filename = self._pending_tabs.pop(widget, None)
+        if filename is None:
+            return
+
+        tab = FileTab(self, filename, self.channel_names.copy(), self.sample_rate)
+        # Apply max_display_samples through the setter so the downsample
+        # buffers and index ramp are sized for the configured budget
+        tab.update_max_display_samples(self.max_display_samples)
+        tab_name = self.tab_widget.tabText(index)
+
+        # Swap silently: removing the current tab would otherwise make a
+        # neighbouring placeholder current and materialize it too
+        tab_widget = self.tab_widget
+        tab_widget.blockSignals(True)
+        try:
+            tab_widget.removeTab(index)
+            tab_widget.insertTab(index, tab, tab_name)
+            tab_widget.setCurrentIndex(index)
+        finally:
+            tab_widget.blockSignals(False)
+
     def close_tab(self, index: int):
         """Close a tab"""
         widget = self.tab_widget.widget(index)
         if isinstance(widget, FileTab):
             if hasattr(widget.reader, 'close'):
                 widget.reader.close()
+        self._pending_tabs.pop(widget, None)
         self.tab_widget.removeTab(index)
         
         # Show welcome screen if no tabs left
@@ -798,17 +1105,45 @@ class BSRExplorer(QMainWindow):
             
             menu.exec(tab_bar.mapToGlobal(position))
     
+    def _close_tabs_batch(self, keep_index=None):
+        """
+        Close tabs in one batch.
+
+        Removing tabs one-by-one triggers a relayout and a cascade of
+        current-index signals per removal; blocking both for the batch and
+        emitting a single currentChanged at the end keeps closing N tabs
+        linear in N.
+        """
+        tab_widget = self.tab_widget
+        tab_widget.setUpdatesEnabled(False)
+        tab_widget.blockSignals(True)
+        try:
+            # Reverse order so remaining indices stay valid
+            for i in range(tab_widget.count() - 1, -1, -1):
+                if i == keep_index:
+                    continue
+                widget = tab_widget.widget(i)
+                if isinstance(widget, FileTab):
+                    if hasattr(widget.reader, 'close'):
+                        widget.reader.close()
+                self._pending_tabs.pop(widget, None)
+                tab_widget.removeTab(i)
+        finally:
+            tab_widget.blockSignals(False)
+            tab_widget.setUpdatesEnabled(True)
+
+        if tab_widget.count() == 0:
+            self.show_empty_state()
+        else:
+            tab_widget.currentChanged.emit(tab_widget.currentIndex())
+
     def close_other_tabs(self, keep_index: int):
         """Close all tabs except the specified one"""
-        # Close tabs in reverse order to maintain indices
-        for i in range(self.tab_widget.count() - 1, -1, -1):
-            if i != keep_index:
-                self.close_tab(i)
-    
+        self._close_tabs_batch(keep_index=keep_index)
+
     def close_all_tabs(self):
         """Close all tabs"""
-        while self.tab_widget.count() > 0:
-            self.close_tab(0)
+        self._close_tabs_batch()
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event for drag and drop"""
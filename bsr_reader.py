@@ -2,9 +2,13 @@
 BSR File Reader Module
 Handles reading and loading BSR binary files efficiently
 """
+import mmap
+
 import numpy as np
 from typing import Optional, Tuple
 
+from bsr_downsample import deinterleave_channels
+
 
 class BSRReader:
     """
@@ -17,6 +21,8 @@ class BSRReader:
         self.filename: Optional[str] = None
         self.sample_rate: int = 200000  # 200 kHz
         self.num_channels: int = 4
+        self._channels: Optional[list] = None  # Cached SoA channel arrays
+        self._channel_cache: dict = {}  # Per-channel contiguous copies
         
     def load_file(self, filename: str) -> bool:
         """
@@ -31,15 +37,27 @@ class BSRReader:
         try:
             # Use memory-mapped file for large files
             data = np.memmap(filename, dtype=np.int32, mode='r')
-            
-            # Reshape to Nx4 format
-            if len(data) % self.num_channels != 0:
+
+            # Hint the kernel that the first pass (deinterleave + initial
+            # downsample) scans the whole file front to back, so it can
+            # readahead instead of faulting in one page at a time.
+            if hasattr(mmap, 'MADV_SEQUENTIAL') and isinstance(data.base, mmap.mmap):
+                data.base.madvise(mmap.MADV_SEQUENTIAL)
+                data.base.madvise(mmap.MADV_WILLNEED)
+
+            # Reshape to Nx4 format; truncate any trailing partial frame
+            rem = data.size % self.num_channels
+            if rem:
                 print(f"Warning: File size not divisible by {self.num_channels}")
-                # Truncate to nearest multiple
-                data = data[:-(len(data) % self.num_channels)]
-            
+                data = data[:data.size - rem]
+
             self.data = data.reshape(-1, self.num_channels)
+            # Slice and reshape must both stay views of the mapping; a
+            # silent copy here would read the whole file eagerly
+            assert self.data.base is data or self.data.base is data.base
             self.filename = filename
+            self._channels = None
+            self._channel_cache.clear()
             return True
             
         except Exception as e:
@@ -50,16 +68,57 @@ class BSRReader:
         """
         Get data for a specific channel.
         
+        The column view into the interleaved memmap has a 16-byte stride,
+        so the first access deinterleaves into a contiguous copy which is
+        cached for the lifetime of the loaded file.
+        
         Args:
             channel_idx: Channel index (0-3)
             
         Returns:
-            Channel data array or None if invalid
+            Contiguous channel data array or None if invalid
         """
         if self.data is None or channel_idx < 0 or channel_idx >= self.num_channels:
             return None
-        return self.data[:, channel_idx]
+        cached = self._channel_cache.get(channel_idx)
+        if cached is None:
+            cached = np.ascontiguousarray(self.data[:, channel_idx])
+            self._channel_cache[channel_idx] = cached
+        return cached
     
+    def get_channels_soa(self, dtype=np.float32) -> Optional[list]:
+        """
+        Get all channels deinterleaved into contiguous arrays (SoA).
+
+        The on-disk layout is interleaved int32, so column views have a
+        16-byte stride; converting once here gives downstream reductions
+        unit-stride access. Converted arrays are cached until the next load.
+
+        Args:
+            dtype: Target dtype of the contiguous copies
+
+        Returns:
+            List of per-channel arrays or None if no data loaded
+        """
+        if self.data is None:
+            return None
+        if self._channels is None or self._channels[0].dtype != dtype:
+            if deinterleave_channels is not None:
+                # Fused pass: every interleaved row is read exactly once
+                out = np.empty((self.num_channels, len(self.data)), dtype=dtype)
+                deinterleave_channels(self.data, out)
+                self._channels = [out[i] for i in range(self.num_channels)]
+            else:
+                # One sequential conversion pass over the file, then an
+                # in-memory transpose, instead of one strided file scan
+                # per channel
+                arr = np.asarray(self.data, dtype=dtype)
+                self._channels = [
+                    np.ascontiguousarray(arr[:, i])
+                    for i in range(self.num_channels)
+                ]
+        return self._channels
+
     def get_all_channels(self) -> Optional[np.ndarray]:
         """
         Get all channel data.
@@ -94,3 +153,5 @@ class BSRReader:
             del self.data
             self.data = None
             self.filename = None
+            self._channels = None
+            self._channel_cache.clear()
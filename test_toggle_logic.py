@@ -104,46 +104,35 @@ class TestHistogramDownsample(unittest.TestCase):
     """Test the optimized histogram downsampling function"""
     
     def histogram_downsample(self, data, time_axis, target_samples):
-        """Copy of the optimized histogram_downsample function for testing"""
+        """Copy of the NumPy fallback histogram_downsample for testing.
+
+        Mirrors the reduceat-based implementation: one fused min and one
+        fused max pass per bin, interleaved [min, max] with bin-edge
+        timestamps, no argmin/argmax or np.where passes.
+        """
         if len(data) <= target_samples or target_samples <= 0:
             return time_axis, data
-        
+
         num_bins = max(1, target_samples // 2)
         bin_size = len(data) // num_bins
-        
+
         if bin_size <= 0:
             return time_axis, data
-        
+
         n_samples = num_bins * bin_size
         data_truncated = data[:n_samples]
-        time_truncated = time_axis[:n_samples]
-        
-        data_bins = data_truncated.reshape(num_bins, bin_size)
-        time_bins = time_truncated.reshape(num_bins, bin_size)
-        
-        min_indices = np.argmin(data_bins, axis=1)
-        max_indices = np.argmax(data_bins, axis=1)
-        
-        bin_range = np.arange(num_bins)
-        min_data = data_bins[bin_range, min_indices]
-        max_data = data_bins[bin_range, max_indices]
-        min_time = time_bins[bin_range, min_indices]
-        max_time = time_bins[bin_range, max_indices]
-        
-        min_first = min_indices <= max_indices
-        
-        first_time = np.where(min_first, min_time, max_time)
-        first_data = np.where(min_first, min_data, max_data)
-        second_time = np.where(min_first, max_time, min_time)
-        second_data = np.where(min_first, max_data, min_data)
-        
+
+        starts = np.arange(num_bins) * bin_size
+        mins = np.minimum.reduceat(data_truncated, starts)
+        maxs = np.maximum.reduceat(data_truncated, starts)
+
         result_time = np.empty(2 * num_bins, dtype=time_axis.dtype)
         result_data = np.empty(2 * num_bins, dtype=data.dtype)
-        result_time[0::2] = first_time
-        result_time[1::2] = second_time
-        result_data[0::2] = first_data
-        result_data[1::2] = second_data
-        
+        result_time[0::2] = time_axis[starts]
+        result_time[1::2] = time_axis[starts + bin_size - 1]
+        result_data[0::2] = mins
+        result_data[1::2] = maxs
+
         return result_time, result_data
     
     def test_no_downsampling_needed(self):
@@ -181,6 +170,21 @@ class TestHistogramDownsample(unittest.TestCase):
         self.assertLessEqual(len(result_data), 100)
         self.assertEqual(len(result_time), len(result_data))
     
+    def test_tsdownsample_preserves_extrema(self):
+        """Test the optional tsdownsample path preserves min and max"""
+        try:
+            from tsdownsample import MinMaxDownsampler
+        except ImportError:
+            self.skipTest("tsdownsample not installed")
+
+        data = np.random.randint(0, 100, 100000).astype(np.float32)
+        idxs = MinMaxDownsampler().downsample(data, n_out=1000, parallel=True)
+        selected = data[idxs]
+
+        self.assertEqual(len(selected), 1000)
+        self.assertEqual(selected.min(), data.min())
+        self.assertEqual(selected.max(), data.max())
+
     def test_downsampling_performance(self):
         """Test that vectorized downsampling is fast"""
         # Large dataset